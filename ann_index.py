@@ -0,0 +1,139 @@
+"""Approximate nearest-neighbor search for large framework libraries
+
+IVFIndex is an inverted-file index implemented with NumPy: embeddings are
+clustered with spherical k-means into ``n_lists`` cells, and a query only
+scans the ``n_probe`` cells whose centroids are closest to it. Raising
+``n_probe`` trades latency for recall; ``n_probe == n_lists`` is exact.
+"""
+import os
+
+import numpy as np
+
+from retrieval import MATCH_COUNT, MATCH_THRESHOLD, LocalVectorIndex, _normalize_rows
+
+N_PROBE = 8
+KMEANS_ITERATIONS = 10
+TRAIN_SAMPLES_PER_LIST = 64
+
+
+def default_n_lists(n):
+    """Roughly 4 * sqrt(n) cells, the usual IVF starting point"""
+    return max(1, int(4 * np.sqrt(n)))
+
+
+def spherical_kmeans(vectors, n_clusters, iterations=KMEANS_ITERATIONS, seed=0):
+    """Cluster normalized vectors by cosine similarity, returning unit centroids"""
+    rng = np.random.default_rng(seed)
+    n_clusters = min(n_clusters, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        empty = ~sums.any(axis=1)
+        # Reseed empty cells with random points so every list stays useful
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        centroids = _normalize_rows(sums)
+    return centroids
+
+
+class IVFIndex(LocalVectorIndex):
+    """Inverted-file ANN index over the same storage as LocalVectorIndex
+
+    Vectors added before ``train()`` are searched exactly; ``train()``
+    clusters everything stored so far, and later ``add()`` calls are
+    assigned to the existing cells incrementally.
+    """
+
+    def __init__(self, dim, n_lists=None, n_probe=N_PROBE, capacity=1024, seed=0, storage="float32"):
+        super().__init__(dim, capacity=capacity, storage=storage)
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.seed = seed
+        self.centroids = None
+        self._lists = []
+
+    @property
+    def trained(self):
+        return self.centroids is not None
+
+    @classmethod
+    def from_local(cls, index, n_lists=None, n_probe=N_PROBE, seed=0):
+        """Build and train an IVF index from a LocalVectorIndex's data"""
+        ivf = cls(index.dim, n_lists=n_lists, n_probe=n_probe, capacity=max(len(index), 1), seed=seed,
+                  storage=index.storage)
+        LocalVectorIndex.add(ivf, index.matrix, index.contents, index.metadata)
+        ivf.train()
+        return ivf
+
+    def train(self, iterations=KMEANS_ITERATIONS):
+        """Cluster the stored vectors and rebuild every inverted list"""
+        n_lists = self.n_lists or default_n_lists(len(self))
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(len(self), n_lists * TRAIN_SAMPLES_PER_LIST)
+        sample = self.vectors(np.sort(rng.choice(len(self), sample_size, replace=False)))
+        self.centroids = spherical_kmeans(sample, n_lists, iterations=iterations, seed=self.seed)
+        self.n_lists = len(self.centroids)
+        self._lists = [np.empty(0, dtype=np.int64) for _ in range(self.n_lists)]
+        self._assign(np.arange(len(self)))
+
+    def _assign(self, ids, chunk_size=8192):
+        """Append ids to the inverted list of their nearest centroid"""
+        assign = np.concatenate([
+            np.argmax(self.vectors(ids[start:start + chunk_size]) @ self.centroids.T, axis=1)
+            for start in range(0, len(ids), chunk_size)
+        ]) if len(ids) else np.empty(0, dtype=np.int64)
+        order = np.argsort(assign, kind="stable")
+        cells, starts = np.unique(assign[order], return_index=True)
+        for cell, members in zip(cells, np.split(ids[order], starts[1:])):
+            self._lists[cell] = np.concatenate([self._lists[cell], members])
+
+    def add(self, embeddings, contents, metadata):
+        start = len(self)
+        super().add(embeddings, contents, metadata)
+        if self.trained:
+            self._assign(np.arange(start, len(self)))
+
+    def _candidates(self, queries, n_probe):
+        """Candidate ids for each query from its n_probe closest cells"""
+        n_probe = min(n_probe, self.n_lists)
+        cell_scores = queries @ self.centroids.T
+        probes = np.argpartition(-cell_scores, n_probe - 1, axis=1)[:, :n_probe]
+        return [np.concatenate([self._lists[cell] for cell in cells]) for cells in probes]
+
+    def search(self, query_embedding, match_threshold=MATCH_THRESHOLD, match_count=MATCH_COUNT, n_probe=None):
+        return self.search_many([query_embedding], match_threshold, match_count, n_probe=n_probe)[0]
+
+    def search_many(self, query_embeddings, match_threshold=MATCH_THRESHOLD, match_count=MATCH_COUNT, n_probe=None):
+        if not self.trained:
+            return super().search_many(query_embeddings, match_threshold, match_count)
+        queries = _normalize_rows(np.asarray(query_embeddings).reshape(-1, self.dim))
+        results = []
+        for query, ids in zip(queries, self._candidates(queries, n_probe or self.n_probe)):
+            scores = self.similarities(query[None], ids)[0]
+            top = self._top_k(scores, match_threshold, match_count)
+            results.append([
+                {'content': self.contents[ids[i]], 'metadata': self.metadata[ids[i]], 'similarity': float(scores[i])}
+                for i in top
+            ])
+        return results
+
+    def save(self, path):
+        """Save the vectors plus centroids so the index loads without retraining"""
+        super().save(path)
+        if self.trained:
+            np.save(os.path.join(path, "centroids.npy"), self.centroids)
+
+    @classmethod
+    def load(cls, path, mmap=True, n_probe=N_PROBE):
+        local = LocalVectorIndex.load(path, mmap=mmap)
+        index = cls(local.dim, n_probe=n_probe, capacity=0, storage=local.storage)
+        index._matrix, index._scales, index._size = local._matrix, local._scales, local._size
+        index.contents, index.metadata = local.contents, local.metadata
+        centroids_path = os.path.join(path, "centroids.npy")
+        if os.path.exists(centroids_path):
+            index.centroids = np.load(centroids_path)
+            index.n_lists = len(index.centroids)
+            index._lists = [np.empty(0, dtype=np.int64) for _ in range(index.n_lists)]
+            index._assign(np.arange(len(index)))
+        return index
@@ -0,0 +1,441 @@
+"""Performance benchmarks for the SHE IS AI framework vectorizer
+
+Run one benchmark by name, e.g.:
+
+    python benchmarks.py embedding --repeat 8 --batch-size 64
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+
+
+def _timed(fn, *args, **kwargs):
+    """Run fn once and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmark_embedding(repeat=8, batch_size=64):
+    """Compare per-chunk get_embedding() calls with batched get_embeddings() on CPU"""
+    import framework_vectorizer as fv
+
+    texts = [chunk["content"] for chunk in fv.chunks] * repeat
+    fv.get_embedding(texts[0], use_cache=False)  # Warm up the model before timing
+
+    per_chunk, per_chunk_s = _timed(lambda: [fv.get_embedding(text, use_cache=False) for text in texts])
+    batched, batched_s = _timed(fv.get_embeddings, texts, batch_size=batch_size, use_cache=False)
+
+    max_diff = float(np.abs(np.asarray(per_chunk, dtype=np.float32) - batched).max())
+    print(f"📝 Texts embedded: {len(texts)}")
+    print(f"🐢 Per-chunk: {per_chunk_s:.2f}s ({len(texts) / per_chunk_s:.1f} chunks/s)")
+    print(f"🚀 Batched (batch_size={batch_size}): {batched_s:.2f}s ({len(texts) / batched_s:.1f} chunks/s)")
+    print(f"⚡ Speedup: {per_chunk_s / batched_s:.2f}x, max abs difference: {max_diff:.2e}")
+
+
+def benchmark_writer(rows=2000, latency=0.02, batch_size=100, max_in_flight=4, fail_every=0):
+    """Compare one insert per row with bulk_write() against a simulated-latency table"""
+    from chunk_writer import bulk_write
+    from local_supabase import LocalSupabase
+
+    data = [{"content": f"chunk {i}", "metadata": {"chunk_id": f"bench_{i:06d}"}, "embedding": [0.0] * 384}
+            for i in range(rows)]
+
+    sample = data[:max(1, min(rows, 100))]
+    client = LocalSupabase(latency=latency)
+    _, per_row_s = _timed(lambda: [client.table("framework_chunks").insert(row).execute() for row in sample])
+    per_row_rate = len(sample) / per_row_s
+
+    client = LocalSupabase(latency=latency, fail_every=fail_every)
+    report = bulk_write(client, data, batch_size=batch_size, max_in_flight=max_in_flight,
+                        base_delay=latency, verbose=False)
+    latencies = sorted(batch["latency"] for batch in report["batches"])
+
+    print(f"🐢 One insert per row: {per_row_rate:.1f} rows/s (sampled {len(sample)} rows)")
+    print(f"🚀 bulk_write: {report['rows_per_second']:.1f} rows/s, "
+          f"{len(report['batches'])} batches, {report['failed']} rows failed")
+    print(f"⏱️  Batch latency p50 {latencies[len(latencies) // 2] * 1000:.0f}ms, "
+          f"max {latencies[-1] * 1000:.0f}ms")
+    print(f"⚡ Speedup: {report['rows_per_second'] / per_row_rate:.1f}x")
+
+
+def benchmark_cache(queries=200, path=".embedding_cache_bench"):
+    """Time repeated query embeddings with a cold and then a warm embedding cache"""
+    import shutil
+    import framework_vectorizer as fv
+    from embedding_cache import EmbeddingCache
+
+    shutil.rmtree(path, ignore_errors=True)
+    fv._embedding_cache = EmbeddingCache(fv.MODEL_NAME, fv.EMBEDDING_DIM, path=path)
+    texts = [f"{chunk['category']} {chunk['content_type']} question {i}"
+             for i in range(queries) for chunk in fv.chunks[:1]]
+
+    _, cold_s = _timed(lambda: [fv.get_embedding(text) for text in texts])
+    _, warm_s = _timed(lambda: [fv.get_embedding(text) for text in texts])
+    stats = fv._embedding_cache.stats()
+    fv._embedding_cache.close()
+    fv._embedding_cache = None
+    shutil.rmtree(path, ignore_errors=True)
+
+    print(f"🥶 Cold cache: {cold_s * 1000 / len(texts):.2f}ms/query")
+    print(f"🔥 Warm cache: {warm_s * 1000 / len(texts):.2f}ms/query ({cold_s / warm_s:.1f}x faster)")
+    print(f"📊 Hits {stats['hits']}, misses {stats['misses']}, evictions {stats['evictions']}")
+
+
+def _percentile_ms(samples, q):
+    return float(np.percentile(samples, q)) * 1000
+
+
+def benchmark_ann(corpus=100_000, queries=200, k=10, n_lists=None, n_probes=(1, 4, 8, 16, 32), dim=384):
+    """Recall@k and p50/p99 latency of IVFIndex against exact LocalVectorIndex search
+
+    Uses a synthetic clustered corpus of unit vectors the size of a large
+    framework library, so it runs without the model.
+    """
+    from ann_index import IVFIndex
+    from retrieval import LocalVectorIndex
+
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((max(corpus // 200, 1), dim)).astype(np.float32)
+    vectors = centers[rng.integers(len(centers), size=corpus)] + 0.6 * rng.standard_normal((corpus, dim)).astype(np.float32)
+    query_vectors = vectors[rng.choice(corpus, queries, replace=False)] + 0.3 * rng.standard_normal((queries, dim)).astype(np.float32)
+
+    exact = LocalVectorIndex(dim, capacity=corpus)
+    exact.add(vectors, [""] * corpus, [{"chunk_id": i} for i in range(corpus)])
+    ivf, build_s = _timed(IVFIndex.from_local, exact, n_lists=n_lists)
+    print(f"🏗️  Built IVF index over {corpus} vectors ({ivf.n_lists} lists) in {build_s:.1f}s")
+
+    def run(search):
+        latencies, ids = [], []
+        for query in query_vectors:
+            matches, elapsed = _timed(search, query)
+            latencies.append(elapsed)
+            ids.append({match["metadata"]["chunk_id"] for match in matches})
+        return latencies, ids
+
+    exact_latencies, truth = run(lambda q: exact.search(q, match_threshold=-1, match_count=k))
+    print(f"🎯 Exact: p50 {_percentile_ms(exact_latencies, 50):.2f}ms, p99 {_percentile_ms(exact_latencies, 99):.2f}ms")
+    for n_probe in n_probes:
+        latencies, found = run(lambda q: ivf.search(q, match_threshold=-1, match_count=k, n_probe=n_probe))
+        recall = np.mean([len(a & b) / k for a, b in zip(found, truth)])
+        print(f"⚡ IVF n_probe={n_probe:>3}: recall@{k} {recall:.3f}, "
+              f"p50 {_percentile_ms(latencies, 50):.2f}ms, p99 {_percentile_ms(latencies, 99):.2f}ms")
+
+
+def benchmark_import(runs=5):
+    """Cold-start cost of importing framework_vectorizer vs loading the model and client
+
+    Each measurement runs in a fresh interpreter so nothing is pre-imported.
+    """
+    import subprocess
+    import sys
+
+    def cold(statement):
+        samples = []
+        for _ in range(runs):
+            _, elapsed = _timed(subprocess.run, [sys.executable, "-c", statement], check=True)
+            samples.append(elapsed)
+        return float(np.median(samples))
+
+    baseline = cold("pass")
+    import_only = cold("import framework_vectorizer") - baseline
+    eager = cold("import framework_vectorizer as fv; fv.get_model(); fv.get_supabase()") - baseline
+    print(f"🪶 import framework_vectorizer: {import_only * 1000:.0f}ms")
+    print(f"🐘 import + model + client (old import-time cost): {eager * 1000:.0f}ms")
+    print(f"⚡ Deferred until first use: {(eager - import_only) * 1000:.0f}ms")
+
+
+def benchmark_parallel(texts=2048, worker_counts=None, threads_per_worker=1, batch_size=32):
+    """Embedding throughput of ParallelEmbedder as the worker count grows
+
+    Model load time is excluded: every pool embeds a warm-up round first.
+    Compare against `embedding` for the single-process baseline.
+    """
+    import framework_vectorizer as fv
+    from parallel_embedding import ParallelEmbedder, available_cpus
+
+    cpus = available_cpus()
+    worker_counts = worker_counts or sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    sentences = [s for chunk in fv.chunks for s in chunk["content"].split(". ")]
+    corpus = [sentences[i % len(sentences)] for i in range(texts)]
+    print(f"🖥️  {cpus} CPUs, {texts} texts, {threads_per_worker} thread(s) per worker")
+
+    baseline = None
+    for workers in worker_counts:
+        with ParallelEmbedder(fv.MODEL_NAME, fv.EMBEDDING_DIM, workers=workers,
+                              threads_per_worker=threads_per_worker, batch_size=batch_size) as embedder:
+            embedder.embed(corpus[:embedder.workers * batch_size])
+            _, elapsed = _timed(embedder.embed, corpus)
+        rate = texts / elapsed
+        baseline = baseline or rate
+        print(f"⚙️  {embedder.workers:>2} workers: {rate:8.1f} texts/s ({rate / baseline:.2f}x)")
+
+
+def benchmark_quantization(corpus=20_000, queries=200, k=10, dim=384):
+    """Memory, serialization speed and retrieval quality of float16/int8 vs float32"""
+    from quantization import STORAGE_FORMATS, decode_embedding, encode_embedding
+    from retrieval import LocalVectorIndex
+
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((max(corpus // 200, 1), dim)).astype(np.float32)
+    vectors = centers[rng.integers(len(centers), size=corpus)] + 0.6 * rng.standard_normal((corpus, dim)).astype(np.float32)
+    query_vectors = vectors[rng.choice(corpus, queries, replace=False)] + 0.3 * rng.standard_normal((queries, dim)).astype(np.float32)
+    sample = vectors[:min(corpus, 2000)]
+
+    json_payloads, json_encode_s = _timed(lambda: [json.dumps(v.tolist()) for v in sample])
+    _, json_decode_s = _timed(lambda: [np.asarray(json.loads(p), dtype=np.float32) for p in json_payloads])
+    json_bytes = np.mean([len(p) for p in json_payloads])
+    print(f"📦 JSON list baseline: {json_bytes:.0f} bytes/vector, "
+          f"encode {json_encode_s * 1e6 / len(sample):.1f}µs, decode {json_decode_s * 1e6 / len(sample):.1f}µs")
+
+    indexes = {}
+    for storage in STORAGE_FORMATS:
+        index = LocalVectorIndex(dim, capacity=corpus, storage=storage)
+        index.add(vectors, [""] * corpus, [{"id": i} for i in range(corpus)])
+        indexes[storage] = index
+
+    baseline = indexes["float32"]
+    normalized = query_vectors / np.linalg.norm(query_vectors, axis=1, keepdims=True)
+    truth = [{m["metadata"]["id"] for m in r} for r in baseline.search_many(query_vectors, -1, k)]
+    base_scores = baseline.similarities(normalized)
+
+    for storage, index in indexes.items():
+        payloads, encode_s = _timed(lambda: [encode_embedding(v, storage) for v in sample])
+        _, decode_s = _timed(lambda: [decode_embedding(p, storage) for p in payloads])
+        results, search_s = _timed(index.search_many, query_vectors, -1, k)
+        recall = np.mean([len({m["metadata"]["id"] for m in r} & t) / k for r, t in zip(results, truth)])
+        scores = index.similarities(normalized)
+        index_bytes = index.codes.nbytes + (index.scales.nbytes if storage == "int8" else 0)
+        print(f"🗜️  {storage:>7}: index {index_bytes / 2**20:6.1f}MiB ({baseline.codes.nbytes / index_bytes:.1f}x smaller), "
+              f"buffer {np.mean([len(p) for p in payloads]):.0f} bytes ({json_bytes / np.mean([len(p) for p in payloads]):.1f}x vs JSON), "
+              f"encode {encode_s * 1e6 / len(sample):.1f}µs, decode {decode_s * 1e6 / len(sample):.1f}µs")
+        print(f"           search {search_s * 1000 / queries:.2f}ms/query, recall@{k} {recall:.4f}, "
+              f"max |Δsimilarity| {np.abs(scores - base_scores).max():.4f}")
+
+
+def benchmark_evaluator(files=200, words_per_file=20_000, keyword_rate=0.002, worker_counts=None):
+    """Keyword evaluation throughput: analyzeContent-style scans vs KeywordScanner,
+    then whole-directory evaluation by worker count
+    """
+    import os
+    import random
+    import tempfile
+    import course_evaluator as ce
+    from parallel_embedding import available_cpus
+
+    rng = random.Random(0)
+    keywords = list(ce.KEYWORD_OWNERS)
+    filler = ("the and of with data model this reading chapter week through about their which using "
+              "introduction overview topics schedule").split()
+    documents = [" ".join(rng.choice(keywords) if rng.random() < keyword_rate else rng.choice(filler)
+                          for _ in range(words_per_file)) for _ in range(files)]
+    total_chars = sum(len(doc) for doc in documents)
+
+    def analyze_content_style(text):
+        # One includes() scan per keyword per list, as in index.html
+        lower = " ".join(text.split()).lower()
+        lists = [ce.EDUCATIONAL_KEYWORDS, ce.NON_EDUCATIONAL_PATTERNS] + \
+            [config["keywords"] for config in ce.FRAMEWORK_AREAS.values()]
+        return [[keyword for keyword in keyword_list if keyword in lower] for keyword_list in lists]
+
+    _, baseline_s = _timed(lambda: [analyze_content_style(doc) for doc in documents])
+    _, scanner_s = _timed(lambda: [ce.evaluate_text(doc) for doc in documents])
+    print(f"📄 {files} documents, {total_chars / 1e6:.1f}M characters, {len(keywords)} distinct keywords")
+    print(f"🔁 analyzeContent-style scans: {total_chars / baseline_s / 1e6:.1f}M chars/s")
+    print(f"🚀 KeywordScanner + scoring: {total_chars / scanner_s / 1e6:.1f}M chars/s "
+          f"({baseline_s / scanner_s:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as root:
+        for i, doc in enumerate(documents):
+            with open(os.path.join(root, f"submission_{i:05d}.txt"), "w", encoding="utf-8") as f:
+                f.write(doc)
+        cpus = available_cpus()
+        for workers in worker_counts or sorted({1, 2, 4, cpus} & set(range(1, cpus + 1))):
+            summary = ce.evaluate_paths([root], workers=workers, output=os.devnull)
+            print(f"⚙️  {workers:>2} workers: {summary['files_per_second']:.1f} files/s, "
+                  f"{summary['characters'] / summary['elapsed'] / 1e6:.1f}M chars/s")
+
+
+def benchmark_semantic(framework_chunks=2000, submissions=200, passages=40, dim=384, repeat=20):
+    """Scoring time of SemanticEvaluator after embedding, for one syllabus and a batch
+
+    Uses random unit vectors with the built-in chunks' categories, so only
+    the similarity matrix and aggregation are timed.
+    """
+    import framework_vectorizer as fv
+    from retrieval import LocalVectorIndex
+    from semantic_evaluator import SemanticEvaluator
+
+    rng = np.random.default_rng(0)
+    index = LocalVectorIndex(dim, capacity=framework_chunks)
+    metadata = [{"chunk_id": f"chunk_{i}", "category": fv.chunks[i % len(fv.chunks)]["category"],
+                 "content_type": fv.chunks[i % len(fv.chunks)]["content_type"]} for i in range(framework_chunks)]
+    index.add(rng.standard_normal((framework_chunks, dim)), [""] * framework_chunks, metadata)
+    evaluator = SemanticEvaluator(index)
+
+    texts = [[f"passage {i}" for i in range(passages)] for _ in range(submissions)]
+    embeddings = rng.standard_normal((submissions * passages, dim)).astype(np.float32)
+
+    single = [_timed(evaluator.score, embeddings[:passages], texts[:1])[1] for _ in range(repeat)]
+    _, batch_s = _timed(evaluator.score, embeddings, texts)
+    print(f"📚 {framework_chunks} framework chunks, {passages} passages per syllabus")
+    print(f"📄 One syllabus: p50 {_percentile_ms(single, 50):.2f}ms, p99 {_percentile_ms(single, 99):.2f}ms")
+    print(f"🚀 {submissions} syllabi in one call: {batch_s * 1000:.1f}ms "
+          f"({batch_s * 1000 / submissions:.2f}ms each)")
+
+
+async def _request(host, port, method, path, payload=None):
+    """One HTTP/1.1 request on a fresh connection; returns (status, body)"""
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body)
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split(b" ", 2)[1]), content
+
+
+def benchmark_service(rps=50, duration=10.0, host="127.0.0.1", port=8080, endpoint="search"):
+    """Open-loop load test of a running evaluation_service at a target request rate
+
+    Requests start on a fixed schedule whether or not earlier ones have
+    finished, so queueing shows up as latency (and 503s) rather than as a
+    lower offered rate.
+    """
+    import framework_vectorizer as fv
+
+    texts = [chunk["content"] for chunk in fv.chunks]
+
+    async def one(i, latencies, statuses):
+        payload = {"query": texts[i % len(texts)]} if endpoint == "search" else {"text": texts[i % len(texts)] * 20}
+        start = time.perf_counter()
+        try:
+            status, _ = await _request(host, port, "POST", f"/{endpoint}", payload)
+        except OSError:
+            status = "connection error"
+        statuses[status] = statuses.get(status, 0) + 1
+        if status == 200:
+            latencies.append(time.perf_counter() - start)
+
+    async def run():
+        latencies, statuses, tasks = [], {}, []
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for i in range(int(rps * duration)):
+            delay = start + i / rps - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(one(i, latencies, statuses)))
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - start
+        _, metrics = await _request(host, port, "GET", "/metrics")
+        return latencies, statuses, elapsed, json.loads(metrics)
+
+    latencies, statuses, elapsed, metrics = asyncio.run(run())
+    print(f"🎯 Target {rps} req/s for {duration:.0f}s against /{endpoint}")
+    print(f"📨 Completed {sum(statuses.values())} requests in {elapsed:.1f}s "
+          f"({sum(statuses.values()) / elapsed:.1f} req/s); status counts: {statuses}")
+    if latencies:
+        print(f"⏱️  Client latency: p50 {_percentile_ms(latencies, 50):.1f}ms, "
+              f"p99 {_percentile_ms(latencies, 99):.1f}ms")
+    for name, stage in sorted(metrics["stages"].items()):
+        print(f"   {name:<18} p50 {stage['p50_ms']:7.2f}ms  p99 {stage['p99_ms']:7.2f}ms  (n={stage['count']})")
+    print(f"📦 Mean micro-batch size: {metrics['mean_batch_size']:.1f}, "
+          f"rejected: {metrics['counters'].get('rejected', 0)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+
+    embedding = sub.add_parser("embedding", help="per-chunk vs batched embedding throughput")
+    embedding.add_argument("--repeat", type=int, default=8, help="times to repeat the chunk corpus")
+    embedding.add_argument("--batch-size", type=int, default=64)
+
+    writer = sub.add_parser("writer", help="per-row vs bulk, pipelined table writes")
+    writer.add_argument("--rows", type=int, default=2000)
+    writer.add_argument("--latency", type=float, default=0.02, help="simulated seconds per request")
+    writer.add_argument("--batch-size", type=int, default=100)
+    writer.add_argument("--max-in-flight", type=int, default=4)
+    writer.add_argument("--fail-every", type=int, default=0, help="fail every n-th request to exercise retries")
+
+    cache = sub.add_parser("cache", help="cold vs warm embedding cache query latency")
+    cache.add_argument("--queries", type=int, default=200)
+
+    ann = sub.add_parser("ann", help="IVF recall@k and latency vs exact search")
+    ann.add_argument("--corpus", type=int, default=100_000)
+    ann.add_argument("--queries", type=int, default=200)
+    ann.add_argument("-k", type=int, default=10)
+    ann.add_argument("--n-lists", type=int, default=None)
+    ann.add_argument("--n-probe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+
+    imports = sub.add_parser("import", help="cold import time vs eager model/client startup")
+    imports.add_argument("--runs", type=int, default=5)
+
+    parallel = sub.add_parser("parallel", help="multi-process embedding throughput by worker count")
+    parallel.add_argument("--texts", type=int, default=2048)
+    parallel.add_argument("--workers", type=int, nargs="+", default=None)
+    parallel.add_argument("--threads-per-worker", type=int, default=1)
+    parallel.add_argument("--batch-size", type=int, default=32)
+
+    quant = sub.add_parser("quantization", help="float16/int8 memory, serialization and recall vs float32")
+    quant.add_argument("--corpus", type=int, default=20_000)
+    quant.add_argument("--queries", type=int, default=200)
+    quant.add_argument("-k", type=int, default=10)
+
+    evaluator = sub.add_parser("evaluator", help="keyword evaluation throughput for course submissions")
+    evaluator.add_argument("--files", type=int, default=200)
+    evaluator.add_argument("--words-per-file", type=int, default=20_000)
+    evaluator.add_argument("--keyword-rate", type=float, default=0.002, help="fraction of words that are keywords")
+    evaluator.add_argument("--workers", type=int, nargs="+", default=None)
+
+    semantic = sub.add_parser("semantic", help="semantic alignment scoring time after embedding")
+    semantic.add_argument("--framework-chunks", type=int, default=2000)
+    semantic.add_argument("--submissions", type=int, default=200)
+    semantic.add_argument("--passages", type=int, default=40)
+
+    service = sub.add_parser("service", help="open-loop load test of a running evaluation_service")
+    service.add_argument("--rps", type=float, default=50, help="target requests per second")
+    service.add_argument("--duration", type=float, default=10.0, help="seconds to generate load")
+    service.add_argument("--host", default="127.0.0.1")
+    service.add_argument("--port", type=int, default=8080)
+    service.add_argument("--endpoint", choices=["search", "evaluate"], default="search")
+
+    args = parser.parse_args()
+    if args.benchmark == "embedding":
+        benchmark_embedding(repeat=args.repeat, batch_size=args.batch_size)
+    elif args.benchmark == "writer":
+        benchmark_writer(rows=args.rows, latency=args.latency, batch_size=args.batch_size,
+                         max_in_flight=args.max_in_flight, fail_every=args.fail_every)
+    elif args.benchmark == "cache":
+        benchmark_cache(queries=args.queries)
+    elif args.benchmark == "ann":
+        benchmark_ann(corpus=args.corpus, queries=args.queries, k=args.k,
+                      n_lists=args.n_lists, n_probes=args.n_probe)
+    elif args.benchmark == "import":
+        benchmark_import(runs=args.runs)
+    elif args.benchmark == "parallel":
+        benchmark_parallel(texts=args.texts, worker_counts=args.workers,
+                           threads_per_worker=args.threads_per_worker, batch_size=args.batch_size)
+    elif args.benchmark == "quantization":
+        benchmark_quantization(corpus=args.corpus, queries=args.queries, k=args.k)
+    elif args.benchmark == "evaluator":
+        benchmark_evaluator(files=args.files, words_per_file=args.words_per_file,
+                            keyword_rate=args.keyword_rate, worker_counts=args.workers)
+    elif args.benchmark == "semantic":
+        benchmark_semantic(framework_chunks=args.framework_chunks, submissions=args.submissions,
+                           passages=args.passages)
+    elif args.benchmark == "service":
+        benchmark_service(rps=args.rps, duration=args.duration, host=args.host, port=args.port,
+                          endpoint=args.endpoint)
+
+
+if __name__ == "__main__":
+    main()
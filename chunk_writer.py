@@ -0,0 +1,130 @@
+"""Bulk, pipelined writes of framework chunk rows to Supabase
+
+Rows are grouped into batches, each batch is sent as one insert (or upsert)
+request, and at most ``max_in_flight`` batches are outstanding at a time.
+Failed batches are retried with exponential backoff; anything that still
+fails is reported back to the caller instead of being dropped.
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+TABLE_NAME = "framework_chunks"
+WRITE_BATCH_SIZE = 100  # Rows per insert request
+MAX_IN_FLIGHT = 4  # Batches outstanding at once
+MAX_RETRIES = 3  # Extra attempts per batch after the first failure
+RETRY_BASE_DELAY = 0.5  # Seconds; doubles on every retry
+
+
+def _batches(rows, batch_size):
+    """Yield lists of up to batch_size rows from any iterable"""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _row_id(row):
+    """Best-effort identifier for a row, used in failure reports"""
+    return (row.get("metadata") or {}).get("chunk_id", row.get("chunk_id"))
+
+
+def write_batch(client, batch, table=TABLE_NAME, upsert=False, on_conflict=None,
+                max_retries=MAX_RETRIES, base_delay=RETRY_BASE_DELAY, sleep=time.sleep):
+    """Write one batch with retries, returning a per-batch report dict"""
+    attempts = 0
+    start = time.perf_counter()
+    while True:
+        attempts += 1
+        try:
+            query = client.table(table)
+            if upsert:
+                query = query.upsert(batch, on_conflict=on_conflict) if on_conflict else query.upsert(batch)
+            else:
+                query = query.insert(batch)
+            query.execute()
+            error = None
+            break
+        except Exception as e:
+            error = str(e)
+            if attempts > max_retries:
+                break
+            sleep(base_delay * 2 ** (attempts - 1))
+
+    return {
+        "rows": len(batch),
+        "attempts": attempts,
+        "latency": time.perf_counter() - start,
+        "error": error,
+        "failed_ids": [_row_id(row) for row in batch] if error else [],
+    }
+
+
+def delete_chunk_ids(client, chunk_ids, table=TABLE_NAME, batch_size=WRITE_BATCH_SIZE,
+                     max_retries=MAX_RETRIES, base_delay=RETRY_BASE_DELAY, sleep=time.sleep):
+    """Delete rows whose metadata chunk_id is in chunk_ids, batch by batch
+
+    Returns the ids that could not be deleted after retries.
+    """
+    failed = []
+    for batch in _batches(chunk_ids, batch_size):
+        for attempt in range(max_retries + 1):
+            try:
+                client.table(table).delete().in_("metadata->>chunk_id", batch).execute()
+                break
+            except Exception as e:
+                if attempt == max_retries:
+                    print(f"❌ Could not delete {len(batch)} rows: {str(e)}")
+                    failed.extend(batch)
+                else:
+                    sleep(base_delay * 2 ** attempt)
+    return failed
+
+
+def bulk_write(client, rows, table=TABLE_NAME, batch_size=WRITE_BATCH_SIZE,
+               max_in_flight=MAX_IN_FLIGHT, upsert=False, on_conflict=None,
+               max_retries=MAX_RETRIES, base_delay=RETRY_BASE_DELAY,
+               sleep=time.sleep, verbose=True):
+    """Write rows in bulk batches with bounded concurrency and retries
+
+    ``rows`` may be any iterable (including a generator); it is consumed
+    lazily, so no more than ``batch_size * max_in_flight`` rows are held in
+    memory. Returns a report with per-batch latency and overall throughput.
+    """
+    report = {"batches": [], "written": 0, "failed": 0, "failed_ids": []}
+    start = time.perf_counter()
+
+    def record(future):
+        batch_report = future.result()
+        report["batches"].append(batch_report)
+        if batch_report["error"]:
+            report["failed"] += batch_report["rows"]
+            report["failed_ids"].extend(batch_report["failed_ids"])
+            if verbose:
+                print(f"❌ Batch of {batch_report['rows']} rows failed after "
+                      f"{batch_report['attempts']} attempts: {batch_report['error']}")
+        else:
+            report["written"] += batch_report["rows"]
+            if verbose:
+                print(f"✅ Wrote {batch_report['rows']} rows in {batch_report['latency'] * 1000:.0f}ms "
+                      f"({batch_report['attempts']} attempt{'s' if batch_report['attempts'] > 1 else ''})")
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        pending = set()
+        for batch in _batches(rows, batch_size):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(future)
+            pending.add(pool.submit(
+                write_batch, client, batch, table=table, upsert=upsert, on_conflict=on_conflict,
+                max_retries=max_retries, base_delay=base_delay, sleep=sleep,
+            ))
+        for future in pending:
+            record(future)
+
+    report["elapsed"] = time.perf_counter() - start
+    report["rows_per_second"] = report["written"] / report["elapsed"] if report["elapsed"] else 0.0
+    return report
@@ -0,0 +1,169 @@
+"""Streaming, token-bounded chunking of course and framework documents
+
+Reads text or markdown files line by line and lazily yields chunk dicts
+with the same fields as the hard-coded ``chunks`` list (chunk_id,
+category, educational_level, content_type, content). Each chunk stays
+under ``max_tokens`` so the embedding model sees all of it, and
+consecutive chunks share up to ``overlap_tokens`` of trailing sentences
+so context isn't lost at the boundaries. Only the current window is held
+in memory, whatever the size of the input.
+"""
+import os
+import re
+from collections import deque
+
+MAX_CHUNK_TOKENS = 250  # all-MiniLM-L6-v2 truncates at 256 including special tokens
+OVERLAP_TOKENS = 40
+MAX_PARAGRAPH_CHARS = 8192  # Buffered paragraph text before its complete sentences are passed on
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_WORD = re.compile(r"\w+|[^\w\s]")
+
+
+def approximate_tokens(text):
+    """Cheap token estimate (words and punctuation) when no tokenizer is given"""
+    return len(_WORD.findall(text))
+
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_") or "chunk"
+
+
+def iter_sections(lines, max_chars=MAX_PARAGRAPH_CHARS):
+    """Yield (heading, paragraph) pairs from an iterable of lines
+
+    Markdown headings are not emitted as paragraphs; they label the
+    paragraphs that follow them. A paragraph longer than ``max_chars`` is
+    yielded in pieces that end on sentence boundaries, so text without
+    blank lines is never held whole.
+    """
+    heading = None
+    paragraph = []
+    size = 0
+    for line in lines:
+        match = _HEADING.match(line)
+        if match or not line.strip():
+            if paragraph:
+                yield heading, " ".join(paragraph)
+                paragraph = []
+                size = 0
+            if match:
+                heading = match.group(2)
+            continue
+        paragraph.append(line.strip())
+        size += len(paragraph[-1]) + 1
+        if size > max_chars:
+            text = " ".join(paragraph)
+            last_end = None
+            for last_end in _SENTENCE_END.finditer(text):
+                pass
+            # Keep the unfinished sentence; with no sentence end at all, pass everything on
+            head, tail = (text[:last_end.start()], text[last_end.end():]) if last_end else (text, "")
+            yield heading, head
+            paragraph = [tail] if tail else []
+            size = len(tail)
+    if paragraph:
+        yield heading, " ".join(paragraph)
+
+
+def _split_long(sentence, max_tokens, count_tokens):
+    """Break a single over-long sentence into word runs that fit max_tokens"""
+    piece = []
+    for word in sentence.split():
+        if piece and count_tokens(" ".join(piece + [word])) > max_tokens:
+            yield " ".join(piece)
+            piece = []
+        piece.append(word)
+    if piece:
+        yield " ".join(piece)
+
+
+def iter_chunk_texts(sections, max_tokens=MAX_CHUNK_TOKENS, overlap_tokens=OVERLAP_TOKENS,
+                     count_tokens=approximate_tokens):
+    """Pack sentences into overlapping, token-bounded windows
+
+    Yields (heading, text) for each window. A new heading always starts a
+    new window so chunks never straddle sections.
+    """
+    window = deque()  # (sentence, tokens)
+    window_tokens = 0
+    window_heading = None
+    fresh = 0  # Sentences in the window not yet emitted in a previous chunk
+
+    def emit():
+        return window_heading, " ".join(sentence for sentence, _ in window)
+
+    def carry_overlap():
+        nonlocal window_tokens
+        while window and window_tokens > overlap_tokens:
+            window_tokens -= window.popleft()[1]
+
+    for heading, paragraph in sections:
+        if heading != window_heading:
+            if fresh:
+                yield emit()
+            window.clear()
+            window_tokens = fresh = 0
+            window_heading = heading
+        for sentence in _SENTENCE_END.split(paragraph):
+            tokens = count_tokens(sentence)
+            pieces = [(sentence, tokens)] if tokens <= max_tokens else [
+                (piece, count_tokens(piece)) for piece in _split_long(sentence, max_tokens, count_tokens)
+            ]
+            for piece, piece_tokens in pieces:
+                if window_tokens + piece_tokens > max_tokens and fresh:
+                    yield emit()
+                    carry_overlap()
+                    fresh = 0
+                # Drop overlap that would leave no room for the new sentence
+                while window and window_tokens + piece_tokens > max_tokens:
+                    window_tokens -= window.popleft()[1]
+                window.append((piece, piece_tokens))
+                window_tokens += piece_tokens
+                fresh += 1
+    if fresh:
+        yield emit()
+
+
+def chunk_file(path, category=None, educational_level="Universal", content_type="Course Material",
+               max_tokens=MAX_CHUNK_TOKENS, overlap_tokens=OVERLAP_TOKENS, count_tokens=approximate_tokens,
+               root=None):
+    """Lazily yield chunk dicts for a text or markdown file
+
+    chunk_ids are ``<path>_<section>_<n>``, with the path taken relative to
+    ``root`` (default: the working directory) and the extension dropped, so
+    re-chunking an unchanged file gives the same ids and same-named files
+    in different folders don't collide. ``category`` defaults to the
+    current markdown heading, falling back to the file name.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = os.path.splitext(os.path.relpath(path, root or os.getcwd()))[0]
+    default_category = category or stem.replace("_", " ").replace("-", " ").title()
+    counts = {}
+    with open(path, encoding="utf-8", errors="replace") as f:
+        windows = iter_chunk_texts(iter_sections(f), max_tokens=max_tokens,
+                                   overlap_tokens=overlap_tokens, count_tokens=count_tokens)
+        for heading, text in windows:
+            prefix = slugify(f"{name}_{heading}" if heading else name)
+            counts[prefix] = counts.get(prefix, 0) + 1
+            yield {
+                "chunk_id": f"{prefix}_{counts[prefix]:03d}",
+                "category": category or heading or default_category,
+                "educational_level": educational_level,
+                "content_type": content_type,
+                "content": text,
+            }
+
+
+def chunk_files(paths, **kwargs):
+    """Chain chunk_file over many paths, expanding directories to .md/.txt files"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith((".md", ".markdown", ".txt")):
+                        yield from chunk_file(os.path.join(root, name), **kwargs)
+        else:
+            yield from chunk_file(path, **kwargs)
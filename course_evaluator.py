@@ -0,0 +1,413 @@
+"""Keyword-based course evaluation against the SHE IS AI framework areas
+
+A Python port of ``analyzeContent`` in index.html, built for scoring a
+whole course catalog:
+
+- every keyword list (educational indicators, non-educational patterns and
+  each framework area) is matched while the document streams in: each
+  block gets one substring search per distinct keyword still missing, and
+  a keyword is retired as soon as it is found;
+- documents are streamed in blocks and scored at full length, not
+  truncated to 5000 characters;
+- scores are deterministic (the Netlify function's ``Math.random()``
+  jitter is gone);
+- directories of submissions are evaluated on a process pool and results
+  are streamed to a JSON Lines file as they complete.
+
+    python course_evaluator.py submissions/ --workers 8 --output results.jsonl
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+READ_BLOCK_SIZE = 1 << 20  # Characters read per block when streaming a file
+MIN_CONTENT_LENGTH = 50
+SUBMISSION_EXTENSIONS = (".txt", ".md", ".markdown", ".html", ".htm", ".csv")
+
+EDUCATIONAL_KEYWORDS = [
+    'learn', 'student', 'curriculum', 'lesson', 'objective', 'assessment', 'education',
+    'teaching', 'course', 'syllabus', 'assignment', 'exam', 'grade', 'classroom',
+    'instructor', 'pedagogy', 'study', 'academic', 'training', 'module', 'unit',
+    'workshop', 'seminar', 'lecture', 'tutorial', 'evaluation', 'feedback',
+    'learning', 'educational', 'teacher', 'professor', 'school', 'university'
+]
+
+NON_EDUCATIONAL_PATTERNS = [
+    # CV/Resume patterns
+    'experience', 'skills', 'employment', 'resume', 'cv', 'curriculum vitae',
+    'work history', 'professional experience', 'references available',
+    # Travel patterns
+    'flight', 'hotel', 'reservation', 'itinerary', 'travel', 'vacation',
+    'departure', 'arrival', 'boarding', 'check-in',
+    # Personal document patterns
+    'address', 'phone number', 'email address', 'date of birth',
+    'social security', 'passport', 'driver license'
+]
+
+FRAMEWORK_AREAS = {
+    'Equity & Inclusion': {
+        'keywords': ['equity', 'inclusion', 'inclusive', 'diverse', 'diversity', 'bias', 'fair', 'fairness',
+                     'accessible', 'accessibility', 'marginalized', 'underrepresented'],
+        'weight': 1.2
+    },
+    'Community Building': {
+        'keywords': ['community', 'collaboration', 'collaborative', 'peer', 'group', 'social', 'relationship',
+                     'belonging', 'connection'],
+        'weight': 1.0
+    },
+    'Assessment Strategy': {
+        'keywords': ['assessment', 'evaluate', 'evaluation', 'portfolio', 'feedback', 'rubric', 'authentic',
+                     'performance', 'reflection'],
+        'weight': 1.1
+    },
+    'Learning Support': {
+        'keywords': ['support', 'accommodation', 'universal', 'neurodivergent', 'learning differences', 'adaptive',
+                     'flexible', 'personalized'],
+        'weight': 1.0
+    },
+    'Pedagogical Practices': {
+        'keywords': ['pedagogy', 'methodology', 'instructional', 'scaffolding', 'inquiry', 'project-based',
+                     'experiential', 'active learning'],
+        'weight': 0.9
+    }
+}
+
+AREA_ANALYSES = {
+    'Equity & Inclusion': {
+        'high': 'Excellent integration of equity and inclusion principles. Your content demonstrates strong awareness of diverse learner needs and inclusive practices.',
+        'medium': 'Good foundation in equity and inclusion with room for enhancement. Consider strengthening bias elimination strategies.',
+        'low': 'Limited explicit equity and inclusion content. Significant opportunity to integrate inclusive design principles.'
+    },
+    'Community Building': {
+        'high': 'Strong emphasis on community building and collaborative learning. Excellent integration of social learning principles.',
+        'medium': 'Some community-building elements present. Consider adding more collaborative and peer-learning opportunities.',
+        'low': 'Limited community-building focus. Opportunity to strengthen social learning and peer interaction components.'
+    },
+    'Assessment Strategy': {
+        'high': 'Comprehensive assessment approach with authentic and varied evaluation methods. Strong alignment with best practices.',
+        'medium': 'Solid assessment foundation with opportunities for more authentic and portfolio-based approaches.',
+        'low': 'Basic assessment strategy. Consider incorporating more authentic, performance-based evaluation methods.'
+    },
+    'Learning Support': {
+        'high': 'Excellent attention to diverse learning needs and support systems. Strong universal design principles.',
+        'medium': 'Some learning support elements present. Consider expanding accommodation and accessibility features.',
+        'low': 'Limited learning support strategies. Opportunity to enhance accessibility and accommodations.'
+    },
+    'Pedagogical Practices': {
+        'high': 'Advanced pedagogical approaches with student-centered, inquiry-based methodologies.',
+        'medium': 'Good pedagogical foundation with opportunities for more innovative teaching strategies.',
+        'low': 'Traditional pedagogical approach. Consider integrating more active and experiential learning methods.'
+    }
+}
+
+AREA_RECOMMENDATIONS = {
+    'Equity & Inclusion': [
+        'Conduct systematic bias audits of course materials',
+        'Integrate diverse perspectives and voices throughout content',
+        'Implement inclusive language and representation standards',
+        'Add explicit discussions of power dynamics and systemic inequities'
+    ],
+    'Community Building': [
+        'Implement structured peer collaboration activities',
+        'Design community-building opening rituals for sessions',
+        'Create opportunities for learner reflection and sharing',
+        'Establish peer mentoring and support systems'
+    ],
+    'Assessment Strategy': [
+        'Develop authentic, real-world assessment tasks',
+        'Implement portfolio-based evaluation methods',
+        'Add peer and self-assessment opportunities',
+        'Create rubrics that value process and growth'
+    ],
+    'Learning Support': [
+        'Implement universal design for learning principles',
+        'Provide multiple ways to access and process content',
+        'Add flexible pacing and deadline options',
+        'Create comprehensive accommodation frameworks'
+    ],
+    'Pedagogical Practices': [
+        'Integrate inquiry-based learning approaches',
+        'Implement project-based and experiential learning',
+        'Add reflective practice and metacognitive strategies',
+        'Design scaffolded learning progressions'
+    ]
+}
+
+# Control characters stripped by readFileContent (tab, newline and carriage return are kept)
+_CONTROL_CHARS = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0xA0)])
+
+
+def _keyword_owners():
+    """Every distinct keyword once, mapped to the lists that contain it"""
+    owners = {}
+    for keyword in EDUCATIONAL_KEYWORDS:
+        owners.setdefault(keyword, []).append('educational')
+    for keyword in NON_EDUCATIONAL_PATTERNS:
+        owners.setdefault(keyword, []).append('non_educational')
+    for area, config in FRAMEWORK_AREAS.items():
+        for keyword in config['keywords']:
+            owners.setdefault(keyword, []).append(area)
+    return owners
+
+
+KEYWORD_OWNERS = _keyword_owners()
+
+
+class KeywordScanner:
+    """Finds which keywords a document contains as its blocks stream in
+
+    Each block is searched once per distinct keyword still pending, with
+    ``str``'s ``in`` (keywords shared by several lists aren't rescanned),
+    and a keyword is retired as soon as it is found, so later blocks only
+    search for what is still missing. The last ``len(longest keyword) - 1``
+    characters of each block are carried over so matches spanning a block
+    boundary are not lost.
+
+    This is deliberately not an Aho-Corasick automaton. A single-pass
+    automaton has to step through every character in Python, which
+    measured several times slower than ~100 C-level substring searches per
+    block. Retiring found keywords also means most documents stop
+    searching long before their end.
+    """
+
+    def __init__(self, keywords=None):
+        self.pending = list(keywords or KEYWORD_OWNERS)
+        self.found = set()
+        self.length = 0  # Characters after whitespace normalization
+        self._overlap = max(map(len, self.pending), default=1) - 1
+        self._tail = ""
+        self._pending_space = False
+
+    def feed(self, block):
+        # Same cleanup as readFileContent: drop control characters, collapse
+        # whitespace, lowercase. A space run split across blocks stays one space.
+        block = block.translate(_CONTROL_CHARS)
+        words = block.lower().split()
+        if not words:
+            if block and self.length:
+                self._pending_space = True
+            return
+        text = " ".join(words)
+        if self.length and (self._pending_space or block[0].isspace()):
+            text = " " + text
+        self._pending_space = block[-1].isspace()
+        self.length += len(text)
+        if not self.pending:
+            return
+        window = self._tail + text
+        still_pending = []
+        for keyword in self.pending:
+            if keyword in window:
+                self.found.add(keyword)
+            else:
+                still_pending.append(keyword)
+        self.pending = still_pending
+        self._tail = window[-self._overlap:] if self._overlap else ""
+
+    def matches(self):
+        return self.found
+
+    def content_length(self):
+        return self.length
+
+
+def _js_round(value):
+    """Math.round semantics (half up), unlike Python's banker's rounding"""
+    return math.floor(value + 0.5)
+
+
+def score_class(score):
+    if score >= 70:
+        return 'score-high'
+    if score >= 40:
+        return 'score-medium'
+    return 'score-low'
+
+
+def area_recommendations(area, score):
+    base = AREA_RECOMMENDATIONS.get(area, [])
+    if score < 40:
+        return ['Significant framework integration needed'] + base[0:3]
+    if score < 70:
+        return ['Good foundation with enhancement opportunities'] + base[1:4]
+    return ['Strong alignment - consider advanced integration'] + base[2:4]
+
+
+def evaluate_matches(matches, content_length, file_name="submission"):
+    """Turn the set of matched keywords into framework results, mirroring analyzeContent"""
+    if content_length < MIN_CONTENT_LENGTH:
+        return [{
+            'title': 'Insufficient Content for Analysis',
+            'category': 'Content Review',
+            'alignment_score': 0,
+            'analysis': 'The submitted file does not contain enough readable text for analysis. Please ensure your file contains substantial educational content.',
+            'recommendations': [
+                'Submit files with substantial text content',
+                'Ensure files are not corrupted or password-protected',
+                'Try converting to plain text format'
+            ],
+            'evidence': [f"File: {file_name}", f"Content length: {content_length} characters"]
+        }]
+
+    educational = [keyword for keyword in EDUCATIONAL_KEYWORDS if keyword in matches]
+    non_educational = [keyword for keyword in NON_EDUCATIONAL_PATTERNS if keyword in matches]
+
+    if len(non_educational) > 3 or len(educational) < 3:
+        content_type = 'personal document (CV, travel plans, etc.)' if len(non_educational) > 3 else 'non-educational content'
+        return [{
+            'title': 'Non-Educational Content Detected',
+            'category': 'Content Classification',
+            'alignment_score': 0,
+            'analysis': f"This appears to be {content_type} rather than educational material. Our framework evaluates courses, curricula, lesson plans, and other educational content.",
+            'recommendations': [
+                'Submit educational materials such as course syllabi or lesson plans',
+                'Include learning objectives and educational methodologies',
+                'Ensure content relates to teaching, learning, or curriculum design'
+            ],
+            'evidence': [
+                f"Educational indicators: {len(educational)}",
+                f"Non-educational patterns: {len(non_educational)}",
+                f"Content type: {content_type}"
+            ]
+        }]
+
+    results = []
+    for area, config in FRAMEWORK_AREAS.items():
+        found = [keyword for keyword in config['keywords'] if keyword in matches]
+        score = min(95, _js_round(len(found) / len(config['keywords']) * 100 * config['weight']))
+        if found or len(results) < 2:
+            level = 'high' if score >= 70 else 'medium' if score >= 40 else 'low'
+            results.append({
+                'title': f"{area} Analysis",
+                'category': area,
+                'alignment_score': score,
+                'scoreClass': score_class(score),
+                'analysis': AREA_ANALYSES[area][level],
+                'recommendations': area_recommendations(area, score),
+                'evidence': [
+                    f"Educational content confirmed ({len(educational)} indicators)",
+                    f"{area} keywords found: {len(found)}/{len(config['keywords'])}",
+                    f"Framework keywords: {', '.join(found[:3])}"
+                ]
+            })
+
+    if not results:
+        results.append({
+            'title': 'Basic Educational Content Analysis',
+            'category': 'General Assessment',
+            'alignment_score': 25,
+            'scoreClass': 'score-low',
+            'analysis': 'Your content appears to be educational but shows limited explicit alignment with equity-centered framework principles.',
+            'recommendations': [
+                'Review the SHE IS AI framework for specific alignment opportunities',
+                'Consider incorporating explicit equity and inclusion language',
+                'Add clear learning objectives and assessment strategies'
+            ],
+            'evidence': [
+                f"Educational content detected ({len(educational)} indicators)",
+                'Limited framework-specific terminology found',
+                'Opportunity for framework integration'
+            ]
+        })
+
+    return results[:5]
+
+
+def evaluate_text(text, file_name="submission"):
+    """Evaluate an in-memory document"""
+    scanner = KeywordScanner()
+    scanner.feed(text)
+    return evaluate_matches(scanner.matches(), scanner.content_length(), file_name)
+
+
+def evaluate_file(path, block_size=READ_BLOCK_SIZE):
+    """Evaluate a file of any size, streaming it through the scanner block by block"""
+    scanner = KeywordScanner()
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for block in iter(lambda: f.read(block_size), ""):
+            scanner.feed(block)
+    return {
+        "file": path,
+        "characters": scanner.content_length(),
+        "results": evaluate_matches(scanner.matches(), scanner.content_length(), os.path.basename(path)),
+    }
+
+
+def _evaluate_file_safe(path):
+    try:
+        return evaluate_file(path)
+    except OSError as e:
+        return {"file": path, "error": str(e), "results": []}
+
+
+def iter_submission_files(paths, extensions=SUBMISSION_EXTENSIONS):
+    """Yield files from paths, expanding directories recursively in sorted order"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(extensions):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def evaluate_paths(paths, workers=None, output=None, chunksize=8):
+    """Evaluate every submission under paths on a process pool
+
+    Results are consumed in input order as workers finish them and, if
+    ``output`` is a path or file object, written there as JSON Lines
+    immediately, so nothing accumulates in memory. Returns a summary dict
+    (files, errors, characters, elapsed, files_per_second), not the
+    results themselves.
+    """
+    files = iter_submission_files(paths)
+    workers = workers or os.cpu_count() or 1
+    close_output = isinstance(output, str)
+    out = open(output, "w", encoding="utf-8") if close_output else output
+    summary = {"files": 0, "errors": 0, "characters": 0}
+    start = time.perf_counter()
+    pool = None
+    try:
+        if workers == 1:
+            results = map(_evaluate_file_safe, files)
+        else:
+            pool = Pool(workers)
+            results = pool.imap(_evaluate_file_safe, files, chunksize=chunksize)
+        for result in results:
+            summary["files"] += 1
+            summary["errors"] += 1 if "error" in result else 0
+            summary["characters"] += result.get("characters", 0)
+            if out is not None:
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        if pool is not None:
+            pool.close()
+            pool.join()
+    except BaseException:
+        if pool is not None:
+            pool.terminate()
+        raise
+    finally:
+        if close_output:
+            out.close()
+    summary["elapsed"] = time.perf_counter() - start
+    summary["files_per_second"] = summary["files"] / summary["elapsed"] if summary["elapsed"] else 0.0
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score course submissions against the SHE IS AI framework areas")
+    parser.add_argument("paths", nargs="+", help="submission files or directories")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--output", default=None, help="JSON Lines output file (default: stdout)")
+    args = parser.parse_args()
+
+    summary = evaluate_paths(args.paths, workers=args.workers, output=args.output or sys.stdout)
+    print(f"✅ Evaluated {summary['files']} files ({summary['errors']} errors) in {summary['elapsed']:.2f}s "
+          f"- {summary['files_per_second']:.1f} files/s, "
+          f"{summary['characters'] / max(summary['elapsed'], 1e-9) / 1e6:.1f}M chars/s", file=sys.stderr)
@@ -0,0 +1,195 @@
+"""Persistent, content-addressed embedding cache with LRU eviction
+
+Vectors live in one fixed-size memory-mapped file, one row per slot,
+stored as float32 or compactly as float16 / int8 (see quantization). A
+SQLite index maps sha256(model name + normalized text) to its slot and a
+last-used tick; when every slot is taken the least recently used one is
+overwritten.
+
+Several processes (say the vectorizer and a running evaluation service)
+can share one cache directory: every lookup and store runs inside a
+SQLite write transaction, which serializes slot allocation and vector
+reads/writes across processes as well as threads. Processes sharing a
+directory must agree on ``max_entries``: a different size starts the
+cache over.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import unicodedata
+from contextlib import contextmanager
+
+import numpy as np
+
+from quantization import check_storage, dequantize, quantize
+
+CACHE_DIR = ".embedding_cache"
+CACHE_MAX_ENTRIES = 50_000  # ~77MB of float32 (~19MB of int8) vectors at 384 dims
+LOCK_TIMEOUT = 30.0  # Seconds to wait for another process's transaction
+
+
+def normalize_text(text):
+    """Normalize text so trivially different spellings share a cache entry"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model_name, text):
+    return hashlib.sha256(f"{model_name}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Embedding cache shared by ingestion and query paths
+
+    ``hits``, ``misses`` and ``evictions`` count cache traffic since the
+    cache was opened; ``stats()`` returns them together with the size.
+    """
+
+    def __init__(self, model_name, dim, path=CACHE_DIR, max_entries=CACHE_MAX_ENTRIES, storage="float32"):
+        self.model_name = model_name
+        self.dim = dim
+        self.storage = check_storage(storage)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly by _transaction()
+        self.conn = sqlite3.connect(os.path.join(path, f"index_{dim}_{storage}.sqlite"), timeout=LOCK_TIMEOUT,
+                                    isolation_level=None, check_same_thread=False)
+        dtype = np.dtype(storage)
+        vectors_path = os.path.join(path, f"vectors_{dim}.{storage}")
+        scales_path = os.path.join(path, f"scales_{dim}.{storage}")
+        shape = (max_entries, dim)
+        # Under the write lock so a process creating the files can't race one opening them
+        with self._transaction():
+            if os.path.exists(vectors_path) and os.path.getsize(vectors_path) == max_entries * dim * dtype.itemsize:
+                mode = "r+"
+                reset_index = False
+            else:
+                # New cache or a different size cap: start over with an empty file
+                mode = "w+"
+                reset_index = True
+            self.vectors = np.memmap(vectors_path, dtype=dtype, mode=mode, shape=shape)
+            self.scales = np.memmap(scales_path, dtype=np.float32, mode=mode, shape=(max_entries,)) \
+                if storage == "int8" else None
+
+            if reset_index:
+                self.conn.execute("DROP TABLE IF EXISTS entries")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, slot INTEGER UNIQUE NOT NULL, last_used INTEGER NOT NULL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_used)")
+        self._tick = 0
+
+    @contextmanager
+    def _transaction(self):
+        """Hold the thread lock and SQLite's write lock for a read-modify-write
+
+        BEGIN IMMEDIATE takes the database write lock up front, so other
+        processes wait (up to LOCK_TIMEOUT) instead of racing for slots.
+        """
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def _sync_tick(self):
+        """Continue from the newest tick any process has written"""
+        newest = self.conn.execute("SELECT COALESCE(MAX(last_used), 0) FROM entries").fetchone()[0]
+        self._tick = max(self._tick, newest)
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self), "max_entries": self.max_entries}
+
+    def lookup(self, texts):
+        """Return (embeddings, missing) for texts
+
+        ``embeddings`` is a float32 array with cached rows filled in and
+        ``missing`` lists the indices that still need to be computed.
+        """
+        keys = [cache_key(self.model_name, text) for text in texts]
+        embeddings = np.zeros((len(texts), self.dim), dtype=np.float32)
+        missing = []
+        with self._transaction():
+            self._sync_tick()
+            slots = {}
+            for start in range(0, len(keys), 500):
+                batch = list(set(keys[start:start + 500]))
+                placeholders = ",".join("?" * len(batch))
+                slots.update(self.conn.execute(
+                    f"SELECT key, slot FROM entries WHERE key IN ({placeholders})", batch
+                ))
+            touched = []
+            for i, key in enumerate(keys):
+                slot = slots.get(key)
+                if slot is None:
+                    missing.append(i)
+                    continue
+                embeddings[i] = self.vectors[slot] if self.scales is None else \
+                    dequantize(self.vectors[slot], self.scales[slot])
+                self._tick += 1
+                touched.append((self._tick, key))
+            self.conn.executemany("UPDATE entries SET last_used = ? WHERE key = ?", touched)
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+        return embeddings, missing
+
+    def store(self, texts, embeddings):
+        """Insert or refresh embeddings for texts, evicting LRU entries if full"""
+        codes, scales = quantize(np.asarray(embeddings, dtype=np.float32).reshape(len(texts), self.dim), self.storage)
+        with self._transaction():
+            self._sync_tick()
+            for text, embedding, scale in zip(texts, codes, scales):
+                key = cache_key(self.model_name, text)
+                self._tick += 1
+                row = self.conn.execute("SELECT slot FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    slot = row[0]
+                    self.conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (self._tick, key))
+                else:
+                    slot = self._free_slot()
+                    self.conn.execute(
+                        "INSERT INTO entries (key, slot, last_used) VALUES (?, ?, ?)", (key, slot, self._tick)
+                    )
+                self.vectors[slot] = embedding
+                if self.scales is not None:
+                    self.scales[slot] = scale
+            # Vectors reach the file before the transaction makes their slots visible
+            self.vectors.flush()
+            if self.scales is not None:
+                self.scales.flush()
+
+    def _free_slot(self):
+        """Next unused slot, or the least recently used one after evicting it"""
+        count = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if count < self.max_entries:
+            used = self.conn.execute("SELECT MAX(slot) FROM entries").fetchone()[0]
+            if used is None or used + 1 < self.max_entries:
+                return 0 if used is None else used + 1
+            # Slots were freed out of order; find the first gap
+            taken = {slot for (slot,) in self.conn.execute("SELECT slot FROM entries")}
+            return next(slot for slot in range(self.max_entries) if slot not in taken)
+        key, slot = self.conn.execute(
+            "SELECT key, slot FROM entries ORDER BY last_used LIMIT 1"
+        ).fetchone()
+        self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self.evictions += 1
+        return slot
+
+    def close(self):
+        with self._lock:
+            self.vectors.flush()
+            self.conn.close()
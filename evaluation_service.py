@@ -0,0 +1,344 @@
+"""Long-running evaluation service with micro-batched query embedding
+
+Keeps the model and a local framework index resident so requests pay
+neither process startup nor model load. Concurrent requests' texts are
+coalesced into micro-batches for one model call, the embedding queue is
+bounded (requests beyond it get 503 instead of piling up), and every
+request records per-stage timings. Passage splitting, search and scoring
+run on worker threads so one large document doesn't stall the loop.
+
+    python evaluation_service.py --port 8080 [--index saved_index/] [--ann]
+
+Endpoints (JSON):
+
+    POST /search    {"query": "...", "match_threshold": 0.3, "match_count": 3}
+    POST /evaluate  {"text": "..."}           semantic alignment scores
+    GET  /metrics   stage timings, p50/p99 latency, queue and batch stats
+    GET  /health
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+from retrieval import MATCH_COUNT, MATCH_THRESHOLD
+
+MAX_BATCH_SIZE = 64  # Texts per coalesced model call
+MAX_BATCH_WAIT = 0.005  # Seconds to wait for more texts once one is queued
+MAX_QUEUE_DEPTH = 1024  # Texts waiting for embedding before requests are rejected
+MAX_LARGE_REQUESTS = 2  # Requests with more texts than the queue holds, admitted at once
+METRICS_WINDOW = 10_000  # Samples kept per timing series
+
+
+class Overloaded(Exception):
+    """The embedding queue is full"""
+
+
+class Metrics:
+    """Rolling timing samples and counters for /metrics"""
+
+    def __init__(self, window=METRICS_WINDOW):
+        self.window = window
+        self.timings = {}
+        self.counters = {}
+
+    def observe(self, name, seconds):
+        self.timings.setdefault(name, deque(maxlen=self.window)).append(seconds)
+
+    def increment(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self):
+        stages = {}
+        for name, samples in self.timings.items():
+            values = np.fromiter(samples, dtype=np.float64) * 1000
+            stages[name] = {
+                "count": len(values),
+                "mean_ms": float(values.mean()),
+                "p50_ms": float(np.percentile(values, 50)),
+                "p99_ms": float(np.percentile(values, 99)),
+            }
+        return {"stages": stages, "counters": dict(self.counters)}
+
+
+class MicroBatcher:
+    """Coalesces concurrent embedding requests into batched model calls
+
+    ``embed`` is a blocking function (texts -> float32 array); it runs on
+    a worker thread so the event loop keeps accepting requests.
+    """
+
+    def __init__(self, embed, metrics, max_batch_size=MAX_BATCH_SIZE, max_wait=MAX_BATCH_WAIT,
+                 max_queue_depth=MAX_QUEUE_DEPTH, max_large_requests=MAX_LARGE_REQUESTS):
+        self._embed = embed
+        self.metrics = metrics
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_large_requests = max_large_requests
+        self.queue = asyncio.Queue(maxsize=max_queue_depth)
+        self._large_requests = 0
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def embed(self, texts):
+        """Embed texts as part of whichever micro-batches they land in
+
+        A request is admitted whole or rejected with Overloaded before any
+        of its texts are queued. Requests with more texts than the queue
+        holds are fed through one batch at a time, waiting for room; at
+        most ``max_large_requests`` of them are admitted at once.
+        """
+        texts = list(texts)
+        if len(texts) > self.queue.maxsize:
+            if self._large_requests >= self.max_large_requests:
+                self.metrics.increment("rejected")
+                raise Overloaded(f"{self._large_requests} large requests already in progress")
+            self._large_requests += 1
+            try:
+                step = min(self.max_batch_size, self.queue.maxsize)
+                parts = []
+                for start in range(0, len(texts), step):
+                    futures = [await self._put(text, wait=True) for text in texts[start:start + step]]
+                    parts.append(np.stack(await asyncio.gather(*futures)))
+                return np.concatenate(parts)
+            finally:
+                self._large_requests -= 1
+
+        if self.queue.maxsize - self.queue.qsize() < len(texts):
+            self.metrics.increment("rejected")
+            raise Overloaded(f"embedding queue is full ({self.queue.qsize()}/{self.queue.maxsize} texts)")
+        futures = [await self._put(text) for text in texts]
+        return np.stack(await asyncio.gather(*futures))
+
+    async def _put(self, text, wait=False):
+        future = asyncio.get_running_loop().create_future()
+        if wait:
+            await self.queue.put((text, future))
+        else:
+            self.queue.put_nowait((text, future))
+        return future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            batch = [(text, future) for text, future in batch if not future.cancelled()]
+            if not batch:
+                continue
+
+            # Identical texts in one batch are embedded once
+            unique = list(dict.fromkeys(text for text, _ in batch))
+            start = time.perf_counter()
+            try:
+                embeddings = await loop.run_in_executor(None, self._embed, unique)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.metrics.observe("embed_batch", time.perf_counter() - start)
+            self.metrics.increment("batches")
+            self.metrics.increment("batched_texts", len(batch))
+            rows = {text: embeddings[i] for i, text in enumerate(unique)}
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(rows[text])
+
+
+class EvaluationService:
+    """Request handlers over a resident index, evaluator and micro-batcher"""
+
+    def __init__(self, index, embed, **batcher_options):
+        from semantic_evaluator import SemanticEvaluator, split_passages
+
+        self.index = index
+        self.metrics = Metrics()
+        self.batcher = MicroBatcher(embed, self.metrics, **batcher_options)
+        self.evaluator = SemanticEvaluator(index, embed=embed)
+        self._split_passages = split_passages
+
+    async def search(self, payload):
+        query = payload["query"]
+        match_threshold = payload.get("match_threshold", MATCH_THRESHOLD)
+        match_count = payload.get("match_count", MATCH_COUNT)
+        if not isinstance(query, str):
+            raise ValueError("query must be a string")
+        if isinstance(match_threshold, bool) or not isinstance(match_threshold, (int, float)):
+            raise ValueError("match_threshold must be a number")
+        if isinstance(match_count, bool) or not isinstance(match_count, int):
+            raise ValueError("match_count must be an integer")
+
+        loop = asyncio.get_running_loop()
+        timings = {}
+        start = time.perf_counter()
+        query_embedding = (await self.batcher.embed([query]))[0]
+        timings["embed"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matches = await loop.run_in_executor(None, self.index.search, query_embedding, match_threshold, match_count)
+        timings["search"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        body = json.dumps({"query": query, "matches": matches}).encode("utf-8")
+        timings["format"] = time.perf_counter() - start
+        return body, timings
+
+    async def evaluate(self, payload):
+        if not isinstance(payload["text"], str):
+            raise ValueError("text must be a string")
+
+        loop = asyncio.get_running_loop()
+        timings = {}
+        start = time.perf_counter()
+        passages = await loop.run_in_executor(None, self._split_passages, payload["text"])
+        embeddings = await self.batcher.embed(passages) if passages else \
+            np.empty((0, self.index.dim), dtype=np.float32)
+        timings["embed"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = (await loop.run_in_executor(None, self.evaluator.score, embeddings, [passages]))[0]
+        timings["search"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        body = json.dumps(result).encode("utf-8")
+        timings["format"] = time.perf_counter() - start
+        return body, timings
+
+    async def dispatch(self, method, path, body):
+        """Return (status, response bytes) for one request"""
+        routes = {("POST", "/search"): self.search, ("POST", "/evaluate"): self.evaluate}
+        if method == "GET" and path == "/health":
+            return 200, b'{"status": "ok"}'
+        if method == "GET" and path == "/metrics":
+            snapshot = self.metrics.snapshot()
+            snapshot["queue_depth"] = self.batcher.queue.qsize()
+            batches = snapshot["counters"].get("batches", 0)
+            snapshot["mean_batch_size"] = snapshot["counters"].get("batched_texts", 0) / batches if batches else 0.0
+            return 200, json.dumps(snapshot).encode("utf-8")
+        handler = routes.get((method, path))
+        if handler is None:
+            return 404, b'{"error": "not found"}'
+
+        start = time.perf_counter()
+        self.metrics.increment("requests")
+        try:
+            payload = json.loads(body or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError("expected a JSON object")
+            response, timings = await handler(payload)
+        except Overloaded as e:
+            return 503, json.dumps({"error": str(e)}).encode("utf-8")
+        except (KeyError, ValueError) as e:
+            self.metrics.increment("bad_requests")
+            return 400, json.dumps({"error": f"bad request: {e}"}).encode("utf-8")
+        except Exception as e:
+            self.metrics.increment("errors")
+            return 500, json.dumps({"error": str(e)}).encode("utf-8")
+        for stage, seconds in timings.items():
+            self.metrics.observe(f"{path.strip('/')}.{stage}", seconds)
+        self.metrics.observe(f"{path.strip('/')}.total", time.perf_counter() - start)
+        return 200, response
+
+    async def handle_connection(self, reader, writer):
+        """Minimal HTTP/1.1 with keep-alive: enough for JSON clients and the load tester"""
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error", 503: "Service Unavailable"}
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, response = await self.dispatch(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {reasons[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(response)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + response
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        self.batcher.start()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"🚀 Evaluation service listening on http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+
+def build_service(index_path=None, ann=False, **batcher_options):
+    """Warm the model and load (or build) the framework index once"""
+    import framework_vectorizer as fv
+    from ann_index import IVFIndex
+    from retrieval import LocalVectorIndex
+
+    print("🧠 Loading model...")
+    fv.warm_up()
+    if index_path:
+        index = (IVFIndex if ann else LocalVectorIndex).load(index_path)
+    else:
+        index = fv.build_local_index(ann=ann, windows=True)
+    print(f"📚 Framework index ready: {len(index)} chunks")
+    return EvaluationService(index, fv.get_embeddings, **batcher_options)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SHE IS AI framework evaluation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--index", help="load a saved LocalVectorIndex/IVFIndex directory instead of embedding the chunks")
+    parser.add_argument("--ann", action="store_true", help="use the IVF approximate index")
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE)
+    parser.add_argument("--max-batch-wait-ms", type=float, default=MAX_BATCH_WAIT * 1000)
+    parser.add_argument("--max-queue-depth", type=int, default=MAX_QUEUE_DEPTH)
+    parser.add_argument("--max-large-requests", type=int, default=MAX_LARGE_REQUESTS,
+                        help="requests with more texts than the queue holds admitted at once")
+    args = parser.parse_args()
+
+    service = build_service(args.index, ann=args.ann, max_batch_size=args.max_batch_size,
+                            max_wait=args.max_batch_wait_ms / 1000, max_queue_depth=args.max_queue_depth,
+                            max_large_requests=args.max_large_requests)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Service stopped")
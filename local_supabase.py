@@ -0,0 +1,113 @@
+"""In-process stand-in for the parts of the Supabase client the vectorizer uses
+
+Lets the writer and search code run offline, in benchmarks, and in tests:
+
+    client = LocalSupabase(latency=0.02, fail_every=5)
+    bulk_write(client, rows)
+    client.rows("framework_chunks")
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+
+class LocalQuery:
+    """Chainable query builder mirroring supabase-py's table API"""
+
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.action = "select"
+        self.payload = None
+        self.on_conflict = None
+        self.filters = []
+
+    def select(self, *columns):
+        self.action = "select"
+        return self
+
+    def insert(self, rows):
+        self.action = "insert"
+        self.payload = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self.action = "upsert"
+        self.payload = rows if isinstance(rows, list) else [rows]
+        self.on_conflict = on_conflict
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    def eq(self, column, value):
+        self.filters.append((column, lambda v: v == value))
+        return self
+
+    def in_(self, column, values):
+        values = set(values)
+        self.filters.append((column, lambda v: v in values))
+        return self
+
+    def execute(self):
+        return self.db._execute(self)
+
+
+class LocalSupabase:
+    """Thread-safe in-memory tables with optional latency and failure injection
+
+    ``fail_every=n`` makes every n-th write request raise, which is enough
+    to exercise retry paths deterministically.
+    """
+
+    def __init__(self, latency=0.0, fail_every=0):
+        self.latency = latency
+        self.fail_every = fail_every
+        self.requests = 0
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def table(self, name):
+        return LocalQuery(self, name)
+
+    def rows(self, table):
+        with self._lock:
+            return list(self._tables.get(table, []))
+
+    @staticmethod
+    def _lookup(row, column):
+        """Resolve plain columns and PostgREST JSON paths like metadata->>chunk_id"""
+        if "->>" in column:
+            column, key = column.split("->>", 1)
+            return (row.get(column) or {}).get(key)
+        return row.get(column)
+
+    def _matches(self, row, filters):
+        return all(test(self._lookup(row, column)) for column, test in filters)
+
+    def _execute(self, query):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            rows = self._tables.setdefault(query.table, [])
+            if query.action in ("insert", "upsert", "delete"):
+                self.requests += 1
+                if self.fail_every and self.requests % self.fail_every == 0:
+                    raise ConnectionError(f"simulated failure on request {self.requests}")
+
+            if query.action == "select":
+                data = [dict(row) for row in rows if self._matches(row, query.filters)]
+            elif query.action == "insert":
+                data = [dict(row) for row in query.payload]
+                rows.extend(data)
+            elif query.action == "upsert":
+                key = query.on_conflict or "id"
+                data = [dict(row) for row in query.payload]
+                incoming = {self._lookup(row, key) for row in data}
+                rows[:] = [row for row in rows if self._lookup(row, key) not in incoming]
+                rows.extend(data)
+            else:
+                data = [row for row in rows if self._matches(row, query.filters)]
+                rows[:] = [row for row in rows if not self._matches(row, query.filters)]
+        return SimpleNamespace(data=data)
@@ -0,0 +1,95 @@
+"""Multi-process embedding across all CPU cores
+
+ParallelEmbedder spreads batches over a pool of worker processes, each
+holding its own SentenceTransformer. Torch's intra-op threads are capped
+per worker so ``workers * threads_per_worker`` never exceeds the cores
+available, and results come back in input order.
+
+    with ParallelEmbedder("all-MiniLM-L6-v2", 384, workers=4) as embedder:
+        embeddings = embedder.embed(texts)
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chunker import approximate_tokens
+
+PARALLEL_BATCH_SIZE = 32
+
+_worker_model = None
+
+
+def available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_worker(model_name, threads):
+    """Pin the thread count before torch is imported, then load the model"""
+    global _worker_model
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    import torch
+    torch.set_num_threads(threads)
+    from sentence_transformers import SentenceTransformer
+    _worker_model = SentenceTransformer(model_name, device="cpu")
+
+
+def _encode_batch(texts):
+    return _worker_model.encode(texts, batch_size=len(texts), convert_to_numpy=True,
+                                show_progress_bar=False).astype(np.float32)
+
+
+class ParallelEmbedder:
+    """Process pool of model replicas for CPU-bound bulk embedding"""
+
+    def __init__(self, model_name, dim, workers=None, threads_per_worker=1, batch_size=PARALLEL_BATCH_SIZE):
+        cpus = available_cpus()
+        threads_per_worker = max(1, min(threads_per_worker, cpus))
+        max_workers = max(1, cpus // threads_per_worker)
+        self.workers = max(1, min(workers or max_workers, max_workers))
+        self.threads_per_worker = threads_per_worker
+        self.model_name = model_name
+        self.dim = dim
+        self.batch_size = batch_size
+        # spawn, not fork: forking a process that already imported torch can deadlock
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_name, threads_per_worker),
+        )
+
+    def embed(self, texts):
+        """Embed texts across the pool, returning a float32 array in input order"""
+        texts = list(texts)
+        embeddings = np.empty((len(texts), self.dim), dtype=np.float32)
+        if not texts:
+            return embeddings
+
+        # Length-sorted batches keep padding low inside each worker
+        order = np.argsort([approximate_tokens(text) for text in texts], kind="stable")
+        batches = [order[start:start + self.batch_size] for start in range(0, len(order), self.batch_size)]
+        try:
+            results = self._pool.map(_encode_batch, [[texts[i] for i in batch] for batch in batches])
+            for batch, result in zip(batches, results):
+                embeddings[batch] = result
+        except BaseException:
+            # A failed batch (or Ctrl-C) tears the pool down instead of leaving workers behind
+            self.close(cancel=True)
+            raise
+        return embeddings
+
+    def close(self, cancel=False):
+        self._pool.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.close(cancel=exc_type is not None)
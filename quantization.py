@@ -0,0 +1,65 @@
+"""Compact float16 / int8 embedding storage
+
+``float16`` halves the size of a float32 vector. ``int8`` stores each
+vector as signed bytes plus one float32 scale (symmetric, per vector), a
+quarter of the size. Both are much smaller than the JSON list of Python
+floats produced by ``embedding.tolist()``.
+
+Buffers for transmission are base64 strings of:
+
+- float16: the little-endian float16 values
+- int8:    a little-endian float32 scale followed by the int8 codes
+"""
+import base64
+
+import numpy as np
+
+STORAGE_FORMATS = ("float32", "float16", "int8")
+
+
+def check_storage(storage):
+    if storage not in STORAGE_FORMATS:
+        raise ValueError(f"storage must be one of {STORAGE_FORMATS}, got {storage!r}")
+    return storage
+
+
+def quantize(embeddings, storage):
+    """Return (codes, scales) for a (n, dim) array in the given storage format
+
+    ``scales`` is all ones except for int8, where codes * scale
+    approximates the original values.
+    """
+    check_storage(storage)
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    scales = np.ones(embeddings.shape[:-1], dtype=np.float32)
+    if storage == "float32":
+        return embeddings, scales
+    if storage == "float16":
+        return embeddings.astype(np.float16), scales
+    scales = np.abs(embeddings).max(axis=-1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.clip(np.rint(embeddings / scales[..., None]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize(codes, scales):
+    return np.asarray(codes, dtype=np.float32) * np.asarray(scales, dtype=np.float32)[..., None]
+
+
+def encode_embedding(embedding, storage):
+    """Serialize one vector to a compact base64 string"""
+    codes, scale = quantize(np.asarray(embedding, dtype=np.float32).reshape(1, -1), storage)
+    payload = codes.astype(codes.dtype.newbyteorder("<")).tobytes()
+    if storage == "int8":
+        payload = scale.astype("<f4").tobytes() + payload
+    return base64.b64encode(payload).decode("ascii")
+
+
+def decode_embedding(buffer, storage):
+    """Inverse of encode_embedding, returning a float32 vector"""
+    raw = base64.b64decode(buffer)
+    if storage == "int8":
+        scale = np.frombuffer(raw[:4], dtype="<f4")[0]
+        return np.frombuffer(raw[4:], dtype=np.int8).astype(np.float32) * scale
+    dtype = "<f2" if check_storage(storage) == "float16" else "<f4"
+    return np.frombuffer(raw, dtype=dtype).astype(np.float32)
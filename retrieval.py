@@ -0,0 +1,198 @@
+"""Retrieval backends for framework chunk similarity search
+
+Every backend answers ``search(query_embedding, match_threshold, match_count)``
+with rows shaped like the ``match_framework_chunks_hf`` RPC result:
+``{"content", "metadata", "similarity"}`` sorted by descending similarity.
+
+- SupabaseRPCBackend calls the Postgres function over the network.
+- LocalVectorIndex keeps every embedding in one contiguous, L2-normalized
+  matrix in process (float32, or compact float16/int8), so queries are a
+  matrix product plus an argpartition and can run offline or in tests.
+"""
+import json
+import os
+
+import numpy as np
+
+from quantization import check_storage, dequantize, quantize
+
+MATCH_THRESHOLD = 0.3  # Lower threshold for Hugging Face embeddings
+MATCH_COUNT = 3
+
+
+def _normalize_rows(matrix):
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class RetrievalBackend:
+    """Interface shared by all retrieval backends"""
+
+    def search(self, query_embedding, match_threshold=MATCH_THRESHOLD, match_count=MATCH_COUNT):
+        raise NotImplementedError
+
+    def search_many(self, query_embeddings, match_threshold=MATCH_THRESHOLD, match_count=MATCH_COUNT):
+        return [self.search(query, match_threshold, match_count) for query in query_embeddings]
+
+
+class SupabaseRPCBackend(RetrievalBackend):
+    """Search through the match_framework_chunks_hf Postgres function"""
+
+    def __init__(self, client, function="match_framework_chunks_hf"):
+        self.client = client
+        self.function = function
+
+    def search(self, query_embedding, match_threshold=MATCH_THRESHOLD, match_count=MATCH_COUNT):
+        result = self.client.rpc(self.function, {
+            'query_embedding': np.asarray(query_embedding, dtype=np.float32).tolist(),
+            'match_threshold': match_threshold,
+            'match_count': match_count
+        }).execute()
+        return result.data
+
+
+class LocalVectorIndex(RetrievalBackend):
+    """Exact cosine search over an in-process embedding matrix
+
+    ``storage`` selects how vectors are kept: ``float32`` (default),
+    ``float16`` or ``int8`` with a per-vector scale (see quantization).
+    Scores are computed directly from the compact arrays, block by block,
+    so a quantized index never materializes a full float32 copy.
+    """
+
+    SCORE_BLOCK_ROWS = 65536
+
+    def __init__(self, dim, capacity=1024, storage="float32"):
+        self.dim = dim
+        self.storage = check_storage(storage)
+        self._matrix = np.empty((capacity, dim), dtype=np.dtype(storage))
+        self._scales = np.ones(capacity, dtype=np.float32)
+        self._size = 0
+        self.contents = []
+        self.metadata = []
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def codes(self):
+        """The live (n, dim) slice of stored (possibly quantized) vectors"""
+        return self._matrix[:self._size]
+
+    @property
+    def scales(self):
+        return self._scales[:self._size]
+
+    @property
+    def matrix(self):
+        """The live (n, dim) normalized embeddings as float32
+
+        Free for float32 storage; a dequantized copy otherwise.
+        """
+        if self.storage == "float32":
+            return self.codes
+        return dequantize(self.codes, self.scales)
+
+    def vectors(self, ids):
+        """float32 embeddings for the given row ids"""
+        return dequantize(self._matrix[ids], self._scales[ids])
+
+    @classmethod
+    def from_rows(cls, rows, storage="float32"):
+        """Build an index from framework_chunks-shaped rows"""
+        rows = list(rows)
+        dim = len(rows[0]['embedding']) if rows else 384
+        index = cls(dim, capacity=max(len(rows), 1), storage=storage)
+        index.add(
+            np.asarray([row['embedding'] for row in rows], dtype=np.float32).reshape(-1, dim),
+            [row['content'] for row in rows],
+            [row['metadata'] for row in rows],
+        )
+        return index
+
+    def add(self, embeddings, contents, metadata):
+        """Append embeddings with their content and metadata"""
+        codes, scales = quantize(_normalize_rows(np.asarray(embeddings).reshape(-1, self.dim)), self.storage)
+        needed = self._size + len(codes)
+        if needed > len(self._matrix):
+            capacity = max(needed, 2 * len(self._matrix))
+            grown = np.empty((capacity, self.dim), dtype=self._matrix.dtype)
+            grown[:self._size] = self.codes
+            self._matrix = grown
+            grown_scales = np.ones(capacity, dtype=np.float32)
+            grown_scales[:self._size] = self.scales
+            self._scales = grown_scales
+        self._matrix[self._size:needed] = codes
+        self._scales[self._size:needed] = scales
+        self._size = needed
+        self.contents.extend(contents)
+        self.metadata.extend(metadata)
+
+    def similarities(self, queries, ids=None):
+        """Cosine scores of queries against stored rows, shape (queries, rows)
+
+        ``queries`` must already be L2-normalized; ``ids`` limits scoring
+        to those rows, in that order.
+        """
+        if self.storage == "float32":
+            matrix = self.codes if ids is None else self._matrix[ids]
+            return queries @ matrix.T
+        n = self._size if ids is None else len(ids)
+        scores = np.empty((len(queries), n), dtype=np.float32)
+        for start in range(0, n, self.SCORE_BLOCK_ROWS):
+            block = slice(start, min(start + self.SCORE_BLOCK_ROWS, n))
+            rows = block if ids is None else ids[block]
+            scores[:, block] = (queries @ self._matrix[rows].astype(np.float32).T) * self._scales[rows]
+        return scores
+
+    def _top_k(self, scores, match_threshold, match_count):
+        """Indices of the best match_count scores above the threshold, best first"""
+        k = min(match_count, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [i for i in top if scores[i] > match_threshold]
+
+    def _rows(self, indices, scores):
+        return [
+            {'content': self.contents[i], 'metadata': self.metadata[i], 'similarity': float(scores[i])}
+            for i in indices
+        ]
+
+    def search(self, query_embedding, match_threshold=MATCH_THRESHOLD, match_count=MATCH_COUNT):
+        return self.search_many([query_embedding], match_threshold, match_count)[0]
+
+    def search_many(self, query_embeddings, match_threshold=MATCH_THRESHOLD, match_count=MATCH_COUNT):
+        """Answer many queries with one (queries x chunks) matrix product"""
+        queries = _normalize_rows(np.asarray(query_embeddings).reshape(-1, self.dim))
+        scores = self.similarities(queries)
+        return [self._rows(self._top_k(row, match_threshold, match_count), row) for row in scores]
+
+    def save(self, path):
+        """Write the matrix as .npy plus a JSON sidecar for content and metadata"""
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "embeddings.npy"), self.codes)
+        if self.storage == "int8":
+            np.save(os.path.join(path, "scales.npy"), self.scales)
+        with open(os.path.join(path, "rows.json"), "w", encoding="utf-8") as f:
+            json.dump({"contents": self.contents, "metadata": self.metadata}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Load a saved index; with mmap the matrix is paged in from disk on demand"""
+        matrix = np.load(os.path.join(path, "embeddings.npy"), mmap_mode="r" if mmap else None)
+        with open(os.path.join(path, "rows.json"), encoding="utf-8") as f:
+            rows = json.load(f)
+        index = cls(matrix.shape[1], capacity=0, storage=matrix.dtype.name)
+        index._matrix = matrix
+        index._size = len(matrix)
+        if index.storage == "int8":
+            index._scales = np.load(os.path.join(path, "scales.npy"))
+        else:
+            index._scales = np.ones(len(matrix), dtype=np.float32)
+        index.contents = rows["contents"]
+        index.metadata = rows["metadata"]
+        return index
@@ -0,0 +1,153 @@
+"""Semantic alignment of course submissions with the framework chunks
+
+Where course_evaluator counts keywords, this scores what a submission
+means: its passages are embedded in batches and compared with every
+framework chunk in one (passages x chunks) cosine similarity matrix. For
+each framework ``category`` (and ``content_type``) a passage's alignment
+is its best similarity to any chunk in that group, and a submission's
+score is the mean of its strongest passages, mapped onto 0-100. The
+passages behind each score are returned as evidence.
+
+    evaluator = SemanticEvaluator.from_framework()
+    results = evaluator.evaluate_many([syllabus_a, syllabus_b])
+"""
+import numpy as np
+
+from chunker import iter_chunk_texts, iter_sections
+from course_evaluator import score_class
+from retrieval import _normalize_rows
+
+PASSAGE_TOKENS = 120  # Passage size for submissions; finer than framework chunks
+TOP_PASSAGES = 3  # Strongest passages averaged into each category score
+EVIDENCE_PASSAGES = 2
+SCORE_BLOCK_PASSAGES = 1024
+# Cosine similarities at or below SCORE_FLOOR map to 0, at or above SCORE_CEILING to 100
+SCORE_FLOOR = 0.15
+SCORE_CEILING = 0.65
+
+
+def split_passages(text, max_tokens=PASSAGE_TOKENS):
+    """Split a submission into token-bounded passages (no overlap)"""
+    return [passage for _, passage in iter_chunk_texts(
+        iter_sections(text.splitlines()), max_tokens=max_tokens, overlap_tokens=0
+    )]
+
+
+def similarity_to_score(similarity):
+    scaled = (np.asarray(similarity) - SCORE_FLOOR) / (SCORE_CEILING - SCORE_FLOOR)
+    return np.rint(np.clip(scaled, 0.0, 1.0) * 100).astype(int)
+
+
+class SemanticEvaluator:
+    """Scores submissions against a framework index's chunks by category
+
+    ``index`` is a LocalVectorIndex (or IVFIndex) of framework chunks whose
+    metadata carries ``category`` and ``content_type``; ``embed`` maps a
+    list of texts to a float32 array and defaults to
+    framework_vectorizer.get_embeddings. Results hold one list per
+    ``group_by`` field, each entry naming its group under that field,
+    e.g. ``result["content_type"][0]["content_type"]``.
+    """
+
+    def __init__(self, index, embed=None, group_by=("category", "content_type")):
+        self.index = index
+        self._embed = embed
+        self.chunk_ids = [meta.get("chunk_id") for meta in index.metadata]
+        # Columns sorted by group so each group is one contiguous slice of the similarity matrix
+        self.groups = {}
+        for field in group_by:
+            labels = [meta.get(field, "Unknown") for meta in index.metadata]
+            order = np.argsort(labels, kind="stable")
+            names, starts = np.unique(np.asarray(labels, dtype=object)[order], return_index=True)
+            self.groups[field] = (list(names), order, starts)
+
+    @classmethod
+    def from_framework(cls, **kwargs):
+        """Evaluator over the built-in framework chunks, embedded locally
+
+        Chunks are indexed as token-bounded windows so text past the
+        model's 256-token limit still counts towards alignment.
+        """
+        import framework_vectorizer
+        return cls(framework_vectorizer.build_local_index(windows=True), **kwargs)
+
+    def embed(self, texts):
+        if self._embed is None:
+            from framework_vectorizer import get_embeddings
+            self._embed = get_embeddings
+        return self._embed(texts)
+
+    def evaluate(self, text):
+        return self.evaluate_many([text])[0]
+
+    def evaluate_many(self, texts):
+        """Embed every submission's passages in one batch, then score them all"""
+        passages = [split_passages(text) for text in texts]
+        flat = [passage for submission in passages for passage in submission]
+        embeddings = self.embed(flat) if flat else np.empty((0, self.index.dim), dtype=np.float32)
+        return self.score(embeddings, passages)
+
+    def score(self, passage_embeddings, passages):
+        """Score precomputed passage embeddings
+
+        ``passage_embeddings`` stacks every submission's passages in order;
+        ``passages`` is one list of passage texts per submission.
+        """
+        queries = _normalize_rows(np.asarray(passage_embeddings).reshape(-1, self.index.dim))
+        per_group = {}
+        for field, (names, _, _) in self.groups.items():
+            # (passages, groups): best similarity to any chunk in each group, and which chunk
+            per_group[field] = (np.empty((len(queries), len(names)), dtype=np.float32),
+                                np.empty((len(queries), len(names)), dtype=np.int64))
+        # Row blocks keep the (passages, chunks) similarity matrix cache-sized for big batches
+        for start in range(0, len(queries), SCORE_BLOCK_PASSAGES):
+            rows = slice(start, start + SCORE_BLOCK_PASSAGES)
+            sims = self.index.similarities(queries[rows])
+            for field, (_, order, starts) in self.groups.items():
+                best, best_chunk = per_group[field]
+                grouped = sims[:, order]
+                for g, (lo, hi) in enumerate(zip(starts, list(starts[1:]) + [len(order)])):
+                    arg = grouped[:, lo:hi].argmax(axis=1)
+                    best[rows, g] = grouped[np.arange(len(grouped)), lo + arg]
+                    best_chunk[rows, g] = order[lo + arg]
+
+        results = []
+        offset = 0
+        for submission in passages:
+            rows = slice(offset, offset + len(submission))
+            offset += len(submission)
+            results.append(self._submission_result(submission, rows, per_group))
+        return results
+
+    def _submission_result(self, submission, rows, per_group):
+        result = {"passages": len(submission)}
+        for field, (group_sims, group_chunks) in per_group.items():
+            names = self.groups[field][0]
+            block = group_sims[rows]
+            chunks = group_chunks[rows]
+            if not len(submission):
+                result[field] = []
+                continue
+            k = min(TOP_PASSAGES, len(submission))
+            similarity = np.partition(block, len(submission) - k, axis=0)[-k:].mean(axis=0)
+            scores = similarity_to_score(similarity)
+            evidence_rows = np.argsort(-block, axis=0, kind="stable")[:EVIDENCE_PASSAGES]
+            entries = []
+            for g, name in enumerate(names):
+                entries.append({
+                    field: name,
+                    "alignment_score": int(scores[g]),
+                    "scoreClass": score_class(int(scores[g])),
+                    "similarity": float(similarity[g]),
+                    "evidence": [
+                        {
+                            "passage": submission[i],
+                            "similarity": float(block[i, g]),
+                            "chunk_id": self.chunk_ids[chunks[i, g]],
+                        }
+                        for i in evidence_rows[:, g]
+                    ],
+                })
+            entries.sort(key=lambda entry: -entry["similarity"])
+            result[field] = entries
+        return result
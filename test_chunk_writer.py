@@ -0,0 +1,121 @@
+"""Tests for chunk_writer against the in-process LocalSupabase fake
+
+    python -m pytest -q test_chunk_writer.py
+"""
+import threading
+
+from chunk_writer import bulk_write, delete_chunk_ids
+from local_supabase import LocalSupabase
+
+TABLE = "framework_chunks"
+
+
+def make_rows(n):
+    return [{"content": f"chunk {i}", "metadata": {"chunk_id": f"chunk_{i:03d}"}} for i in range(n)]
+
+
+def no_sleep(seconds):
+    pass
+
+
+class CountingSupabase(LocalSupabase):
+    """LocalSupabase that records the most requests ever running at once"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.max_active = 0
+        self._count_lock = threading.Lock()
+
+    def _execute(self, query):
+        with self._count_lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            return super()._execute(query)
+        finally:
+            with self._count_lock:
+                self.active -= 1
+
+
+def test_bulk_write_writes_every_row_in_batches():
+    client = LocalSupabase()
+    report = bulk_write(client, iter(make_rows(250)), batch_size=100, verbose=False)
+
+    assert report["written"] == 250
+    assert report["failed"] == 0
+    assert report["failed_ids"] == []
+    assert sorted(batch["rows"] for batch in report["batches"]) == [50, 100, 100]
+    assert len(client.rows(TABLE)) == 250
+
+
+def test_bulk_write_retries_failed_batches():
+    client = LocalSupabase(fail_every=2)
+    report = bulk_write(client, make_rows(100), batch_size=10, max_in_flight=1, sleep=no_sleep, verbose=False)
+
+    assert report["written"] == 100
+    assert report["failed_ids"] == []
+    assert any(batch["attempts"] > 1 for batch in report["batches"])
+    assert len(client.rows(TABLE)) == 100
+
+
+def test_bulk_write_reports_ids_of_batches_that_keep_failing():
+    client = LocalSupabase(fail_every=1)
+    report = bulk_write(client, make_rows(25), batch_size=10, max_retries=2, sleep=no_sleep, verbose=False)
+
+    assert report["written"] == 0
+    assert report["failed"] == 25
+    assert sorted(report["failed_ids"]) == [f"chunk_{i:03d}" for i in range(25)]
+    assert all(batch["attempts"] == 3 and batch["error"] for batch in report["batches"])
+    assert client.rows(TABLE) == []
+
+
+def test_bulk_write_bounds_batches_in_flight():
+    client = CountingSupabase(latency=0.01)
+    report = bulk_write(client, make_rows(200), batch_size=10, max_in_flight=3, verbose=False)
+
+    assert report["written"] == 200
+    assert 1 < client.max_active <= 3
+
+
+def test_bulk_write_consumes_rows_lazily():
+    consumed = 0
+    seen_written = []
+    client = LocalSupabase(latency=0.01)
+
+    def rows():
+        nonlocal consumed
+        for row in make_rows(200):
+            consumed += 1
+            seen_written.append(consumed - len(client.rows(TABLE)))
+            yield row
+
+    bulk_write(client, rows(), batch_size=10, max_in_flight=2, verbose=False)
+    # Rows pulled but not yet written: batches in flight plus the one being filled
+    assert max(seen_written) <= 10 * 3
+
+
+def test_delete_chunk_ids_removes_matching_rows():
+    client = LocalSupabase()
+    bulk_write(client, make_rows(30), verbose=False)
+
+    failed = delete_chunk_ids(client, [f"chunk_{i:03d}" for i in range(0, 30, 2)], batch_size=4)
+
+    assert failed == []
+    assert sorted(row["metadata"]["chunk_id"] for row in client.rows(TABLE)) == \
+        [f"chunk_{i:03d}" for i in range(1, 30, 2)]
+
+
+def test_delete_chunk_ids_retries_then_returns_undeleted_ids():
+    client = LocalSupabase()
+    bulk_write(client, make_rows(10), verbose=False)
+
+    client.fail_every = 2
+    client.requests = 0
+    assert delete_chunk_ids(client, ["chunk_000", "chunk_001"], batch_size=1, sleep=no_sleep) == []
+    assert len(client.rows(TABLE)) == 8
+
+    client.fail_every = 1
+    failed = delete_chunk_ids(client, ["chunk_002", "chunk_003"], batch_size=1, max_retries=1, sleep=no_sleep)
+    assert failed == ["chunk_002", "chunk_003"]
+    assert len(client.rows(TABLE)) == 8
@@ -0,0 +1,79 @@
+"""Local manifest of what has already been vectorized and uploaded
+
+Maps each chunk_id to a hash of its content, metadata, the embedding
+model name and the row storage format, stored in a small SQLite file.
+Incremental runs compare the current chunks against it to find what is
+new, changed, or gone.
+"""
+import hashlib
+import json
+import sqlite3
+
+MANIFEST_PATH = ".vector_manifest.sqlite"
+
+
+def chunk_hash(chunk, model_name, storage="float32"):
+    """Stable hash of everything that affects a chunk's stored row"""
+    metadata = {key: value for key, value in chunk.items() if key != "content"}
+    payload = json.dumps(
+        {"model": model_name, "storage": storage, "content": chunk["content"], "metadata": metadata},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ChunkManifest:
+    """SQLite-backed chunk_id -> hash mapping"""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunks (chunk_id TEXT PRIMARY KEY, hash TEXT NOT NULL)"
+        )
+        self.conn.commit()
+
+    def load(self):
+        return dict(self.conn.execute("SELECT chunk_id, hash FROM chunks"))
+
+    def update(self, hashes):
+        """Record chunk_id -> hash pairs after they were uploaded"""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO chunks (chunk_id, hash) VALUES (?, ?)", hashes.items()
+        )
+        self.conn.commit()
+
+    def remove(self, chunk_ids):
+        self.conn.executemany("DELETE FROM chunks WHERE chunk_id = ?", [(i,) for i in chunk_ids])
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def diff_chunks(chunks, stored, model_name, storage="float32"):
+    """Split chunks into new, changed, and unchanged, plus ids that disappeared
+
+    Returns (new, changed, unchanged_ids, removed_ids, hashes) where ``new``
+    and ``changed`` are lists of chunks and ``hashes`` covers every current
+    chunk.
+    """
+    hashes = {chunk["chunk_id"]: chunk_hash(chunk, model_name, storage) for chunk in chunks}
+    new, changed, unchanged = [], [], []
+    for chunk in chunks:
+        previous = stored.get(chunk["chunk_id"])
+        if previous is None:
+            new.append(chunk)
+        elif previous != hashes[chunk["chunk_id"]]:
+            changed.append(chunk)
+        else:
+            unchanged.append(chunk["chunk_id"])
+    removed = sorted(set(stored) - set(hashes))
+    return new, changed, unchanged, removed, hashes